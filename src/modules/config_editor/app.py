@@ -3,9 +3,54 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, Menu, ttk
 import os
+import copy
+import itertools
+import queue
+import threading
 from . import yaml_io 
 
+_YAML_FILETYPES = (("YAML files", "*.yaml *.yml"), ("All files", "*.*")) # Shared by the open/save dialogs
+
+# --- Value coercion for edited cells ---
+# Spellings accepted for booleans and nulls (compared case-insensitively).
+_TRUE_STRINGS = frozenset({"true", "yes", "1", "on"})
+_FALSE_STRINGS = frozenset({"false", "no", "0", "off"})
+_NULL_STRINGS = frozenset({"null", "none", "~", ""})
+
+def _to_bool(value_str):
+    lowered = value_str.lower()
+    if lowered in _TRUE_STRINGS: return True
+    if lowered in _FALSE_STRINGS: return False
+    raise ValueError(f"'{value_str}' is not a valid boolean representation.")
+
+def _infer_value(value_str):
+    """Guesses a type for a value whose original was null: bool, int, float, null, else string."""
+    lowered = value_str.lower()
+    if lowered in _TRUE_STRINGS: return True
+    if lowered in _FALSE_STRINGS: return False
+    if value_str.lstrip('-').isdigit(): return int(value_str)
+    if '.' in value_str and value_str.replace('.', '', 1).lstrip('-').isdigit(): return float(value_str)
+    if lowered in _NULL_STRINGS: return None
+    return value_str
+
+# Keyed by the type of the value being replaced; any other type keeps the text as a string.
+_COERCERS = {bool: _to_bool, int: int, float: float, type(None): _infer_value}
+
+def _coerce_edited_value(original_value, value_str):
+    """
+    Converts the text typed into a cell to the type of the value it replaces.
+
+    Raises:
+        ValueError: If value_str cannot be converted to the original value's type.
+    """
+    coercer = _COERCERS.get(type(original_value))
+    return coercer(value_str) if coercer else value_str
+
 class ConfigEditorApp:
+    WINDOW_TITLE = "Fish Eco Sim - Config Editor Alpha"
+    IO_POLL_INTERVAL_MS = 50 # How often the Tk loop checks for finished background I/O
+    CHILDREN_PAGE_SIZE = 200 # Max children inserted per expand; the rest load on demand
+
     def __init__(self, root_window):
         self.root = root_window
         self.root.title("Fish Eco Sim - Config Editor Alpha (a0.1.3.4)") # Updated version
@@ -14,40 +59,59 @@ class ConfigEditorApp:
         self.current_filepath = None
         self.config_data = None
         self._editing_item_id = None
-        self.item_id_to_path = {} 
+        # Treeview iids are str(index) into this list of (container, key_or_index) pairs locating
+        # each item's value in self.config_data, so edits write straight into the container.
+        self._iid_to_parent = []
+        self._placeholder_ids = {} # Container iid -> iid of its "not yet populated" child
+        self._load_more_ids = {} # "Load next page" item iid -> (parent iid, data node, next child index)
+
+        # Background I/O: workers push (callback, result, error) onto the queue,
+        # and the Tk thread drains it, since Tk must only be touched from the main thread.
+        self._io_queue = queue.Queue()
+        self._io_lock = threading.Lock() # Serializes background loads and saves against each other
+        self._pending_io = 0
+        self._pending_open_path = None # Most recently requested open; older results are dropped
 
         self.create_menu()
         self.create_widgets()
 
-    # --- Helper functions for nested data access ---
-    def _get_value_from_path(self, data_path_tuple):
-        """Gets a value from self.config_data using a path tuple."""
-        current_level = self.config_data
-        try:
-            for key_or_index in data_path_tuple:
-                current_level = current_level[key_or_index]
-            return current_level
-        except (KeyError, IndexError, TypeError):
-            # TypeError can happen if trying to index a non-collection (e.g. scalar)
-            # This indicates an issue with the path or data structure
-            messagebox.showerror("Internal Error", f"Could not retrieve data at path: {data_path_tuple}")
-            return None # Or raise an exception
-
-    def _set_value_at_path(self, data_path_tuple, new_value):
-        """Sets a value in self.config_data using a path tuple."""
-        current_level = self.config_data
+    # --- Background I/O helpers ---
+    def _run_in_background(self, work, on_done, writes_file=False):
+        """
+        Runs work() on a worker thread, then calls on_done(result, error) on the Tk thread.
+        Pass writes_file=True for saves: their thread is not a daemon, so exiting
+        mid-save does not leave a truncated file behind.
+        """
+        def worker():
+            try:
+                with self._io_lock:
+                    result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self._io_queue.put((on_done, result, error))
+
+        self._pending_io += 1
+        self.root.config(cursor="watch")
+        threading.Thread(target=worker, daemon=not writes_file).start()
+        if self._pending_io == 1:
+            self.root.after(self.IO_POLL_INTERVAL_MS, self._poll_io_queue)
+
+    def _poll_io_queue(self):
+        """Delivers finished background I/O results; reschedules itself while work is pending."""
         try:
-            # Navigate to the parent of the target
-            for key_or_index in data_path_tuple[:-1]: # All but the last element of the path
-                current_level = current_level[key_or_index]
-            
-            # Set the value on the final key/index
-            last_key_or_index = data_path_tuple[-1]
-            current_level[last_key_or_index] = new_value
-            return True
-        except (KeyError, IndexError, TypeError):
-            messagebox.showerror("Internal Error", f"Could not set data at path: {data_path_tuple}")
-            return False
+            while True:
+                try:
+                    on_done, result, error = self._io_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending_io -= 1
+                on_done(result, error)
+        finally:
+            # Keep polling even if a callback raised, or queued results would never be delivered.
+            if self._pending_io:
+                self.root.after(self.IO_POLL_INTERVAL_MS, self._poll_io_queue)
+            else:
+                self.root.config(cursor="")
 
 
     # --- UI Creation methods (mostly unchanged from a0.1.3.3) ---
@@ -64,7 +128,6 @@ class ConfigEditorApp:
         file_menu.add_command(label="Exit", command=self.exit_app)
 
     def create_widgets(self):
-        # ... (same)
         tree_frame = ttk.Frame(self.root, padding="3 3 3 3")
         tree_frame.pack(expand=True, fill=tk.BOTH)
         self.tree = ttk.Treeview(tree_frame, columns=("Value"), show="tree headings")
@@ -82,203 +145,264 @@ class ConfigEditorApp:
         tree_frame.grid_columnconfigure(0, weight=1)
         self.tree.bind("<Double-1>", self.on_tree_double_click)
         self.tree.bind("<Return>", self.on_tree_return_key)
+        self.tree.bind("<<TreeviewOpen>>", self.on_tree_open)
+        self._bind_tree_methods()
+        self._create_cell_editor()
+
+    def _create_cell_editor(self):
+        """Creates the single Entry reused for every cell edit; it stays hidden until an edit starts."""
+        self._editor_var = tk.StringVar()
+        self._cell_editor = ttk.Entry(self.tree, textvariable=self._editor_var)
+        self._cell_editor.bind("<Return>", self.on_edit_confirm)
+        self._cell_editor.bind("<KP_Enter>", self.on_edit_confirm)
+        self._cell_editor.bind("<FocusOut>", self.on_edit_confirm)
+        self._cell_editor.bind("<Escape>", self.on_edit_cancel)
+
+    def _bind_tree_methods(self):
+        """Caches the bound Treeview methods used by the event handlers, which run on every click/key."""
+        self._tree_identify_region = self.tree.identify_region
+        self._tree_identify_column = self.tree.identify_column
+        self._tree_identify_row = self.tree.identify_row
+        self._tree_focus = self.tree.focus
+        self._tree_item = self.tree.item
+        self._tree_bbox = self.tree.bbox
 
-    # --- Display methods (unchanged from a0.1.3.3) ---
+    # --- Display methods ---
     def display_config_data(self):
-        # ... (same)
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.item_id_to_path.clear()
+        if self._editing_item_id is not None: self._hide_cell_editor() # Its iid is about to be reused
+        children = self.tree.get_children()
+        if children: self.tree.delete(*children) # One Tcl call instead of one per item
+        self._iid_to_parent.clear()
+        self._placeholder_ids.clear()
+        self._load_more_ids.clear()
         if self.config_data is None: return
-        self._populate_tree(parent_tree_id="", data_node=self.config_data, current_data_path=())
+        self._populate_tree("", self.config_data)
 
-    def _generate_unique_iid(self, base_path_tuple):
-        # ... (same)
-        return str(base_path_tuple)
+    def _generate_unique_iid(self, parent_and_key):
+        """Allocates the next integer iid and records the (container, key_or_index) it stands for."""
+        self._iid_to_parent.append(parent_and_key)
+        return str(len(self._iid_to_parent) - 1)
+
+    def _parent_for_item(self, item_id):
+        """Returns (container, key_or_index) for a Treeview iid, or None if it has none."""
+        try:
+            return self._iid_to_parent[int(item_id)]
+        except (ValueError, IndexError):
+            return None
+
+    def _populate_tree(self, parent_tree_id, data_node, start=0):
+        """
+        Inserts up to CHILDREN_PAGE_SIZE direct children of data_node, beginning at
+        child index start, under parent_tree_id. If more remain, a "load next" item
+        is appended that inserts the following page when activated. Non-empty
+        containers only get a placeholder child, so that they show an expand arrow;
+        their real children are inserted by on_tree_open when first expanded.
 
-    def _populate_tree(self, parent_tree_id, data_node, current_data_path):
-        # ... (same as a0.1.3.3)
+        Returns:
+            The iid of the first child inserted, or None if none were.
+        """
+        stop = start + self.CHILDREN_PAGE_SIZE
+        # Only the children actually inserted get their text formatted. Lists are sliced directly;
+        # islice still steps over the first start dict entries (in C), so dict pages cost O(start).
         if isinstance(data_node, dict):
-            for key, value_node in data_node.items():
-                item_display_text = str(key)
-                new_data_path = current_data_path + (key,)
-                tree_item_id = self._generate_unique_iid(new_data_path)
-                self.item_id_to_path[tree_item_id] = new_data_path 
-
-                if isinstance(value_node, (dict, list)): 
-                    inserted_id = self.tree.insert(parent_tree_id, tk.END, text=item_display_text, iid=tree_item_id, open=False)
-                    self._populate_tree(inserted_id, value_node, new_data_path)
-                else: 
-                    self.tree.insert(parent_tree_id, tk.END, text=item_display_text, values=(str(value_node),), iid=tree_item_id)
+            children = itertools.islice(data_node.items(), start, stop)
+            format_text = str
         elif isinstance(data_node, list):
-            for index, value_node in enumerate(data_node):
-                item_display_text = f"[{index}]" 
-                new_data_path = current_data_path + (index,)
-                tree_item_id = self._generate_unique_iid(new_data_path)
-                self.item_id_to_path[tree_item_id] = new_data_path
-
-                if isinstance(value_node, (dict, list)):
-                    inserted_id = self.tree.insert(parent_tree_id, tk.END, text=item_display_text, iid=tree_item_id, open=False)
-                    self._populate_tree(inserted_id, value_node, new_data_path)
-                else: 
-                    self.tree.insert(parent_tree_id, tk.END, text=item_display_text, values=(str(value_node),), iid=tree_item_id)
+            children = enumerate(data_node[start:stop], start)
+            format_text = "[{}]".format
+        else:
+            return None
+
+        # Bind hot lookups to locals once; this loop runs for every child of the node.
+        tree_insert = self.tree.insert
+        generate_iid = self._generate_unique_iid
+        placeholder_ids = self._placeholder_ids
+        end = tk.END
+        first_item_id = None
+
+        for key_or_index, value_node in children:
+            tree_item_id = generate_iid((data_node, key_or_index))
+            item_display_text = format_text(key_or_index)
+
+            if isinstance(value_node, (dict, list)):
+                tree_insert(parent_tree_id, end, text=item_display_text, iid=tree_item_id, open=False)
+                if value_node:
+                    placeholder_ids[tree_item_id] = tree_insert(tree_item_id, end, text="...", iid=generate_iid(None))
+            else:
+                tree_insert(parent_tree_id, end, text=item_display_text, values=(str(value_node),), iid=tree_item_id)
+            if first_item_id is None: first_item_id = tree_item_id
+
+        remaining = len(data_node) - stop
+        if remaining > 0:
+            next_count = min(remaining, self.CHILDREN_PAGE_SIZE)
+            load_more_id = tree_insert(parent_tree_id, end, text=f"... load next {next_count} of {remaining} remaining ...", iid=generate_iid(None))
+            self._load_more_ids[load_more_id] = (parent_tree_id, data_node, stop)
+        return first_item_id
+
+    def _load_more_children(self, load_more_id):
+        """
+        Replaces a "load next" item with the next page of its parent's children, and moves
+        focus to the first of them so keyboard navigation continues from there.
+        """
+        parent_tree_id, data_node, start = self._load_more_ids.pop(load_more_id)
+        self.tree.delete(load_more_id)
+        first_item_id = self._populate_tree(parent_tree_id, data_node, start)
+        if first_item_id is not None:
+            self.tree.focus(first_item_id)
+            self.tree.selection_set(first_item_id)
+            self.tree.see(first_item_id)
+
+    def on_tree_open(self, event):
+        """Replaces a container's placeholder with its real children the first time it is expanded."""
+        item_id = self._tree_focus()
+        placeholder_id = self._placeholder_ids.pop(item_id, None)
+        if placeholder_id is None: return # Already populated, or not a container
+        self.tree.delete(placeholder_id)
+        container, key_or_index = self._parent_for_item(item_id)
+        self._populate_tree(item_id, container[key_or_index])
 
     # --- Editing methods (on_edit_confirm is REVISED) ---
     def on_tree_return_key(self, event):
-        # ... (same as a0.1.3.3)
-        selected_item_id = self.tree.focus() 
+        selected_item_id = self._tree_focus() 
         if not selected_item_id: return
-        if self.tree.item(selected_item_id, "values"): 
+        if selected_item_id in self._load_more_ids:
+            self._load_more_children(selected_item_id)
+            return "break" # Skip the class binding, which would act on the row that replaced it
+        if self._tree_item(selected_item_id, "values"): 
             try:
-                bbox = self.tree.bbox(selected_item_id, column="#1")
+                bbox = self._tree_bbox(selected_item_id, column="#1")
                 if bbox:
                     self._setup_cell_editor(selected_item_id, column_id_to_edit="#1")
             except tk.TclError: pass
 
     def on_tree_double_click(self, event):
-        # ... (same as a0.1.3.3)
-        region = self.tree.identify_region(event.x, event.y)
-        column_id_clicked = self.tree.identify_column(event.x)
-        item_id = self.tree.identify_row(event.y)
+        region = self._tree_identify_region(event.x, event.y)
+        column_id_clicked = self._tree_identify_column(event.x)
+        item_id = self._tree_identify_row(event.y)
         if not item_id: return
-        if region == "cell" and column_id_clicked == "#1" and self.tree.item(item_id, "values"):
+        if item_id in self._load_more_ids:
+            self._load_more_children(item_id)
+            return "break" # Skip the class binding, which would act on the row that replaced it
+        if region == "cell" and column_id_clicked == "#1" and self._tree_item(item_id, "values"):
             self._setup_cell_editor(item_id, column_id_clicked)
 
     def _setup_cell_editor(self, item_id, column_id_to_edit):
-        # ... (same as a0.1.3.3)
-        if hasattr(self, '_active_editor') and self._active_editor and self._active_editor.winfo_exists():
-            self._active_editor.destroy()
-        self._editing_item_id = item_id
-        x, y, width, height = self.tree.bbox(item_id, column=column_id_to_edit)
-        current_values_tuple = self.tree.item(item_id, "values")
+        current_values_tuple = self._tree_item(item_id, "values")
         if not current_values_tuple: return
-        current_value_str = str(current_values_tuple[0])
-        entry_var = tk.StringVar(value=current_value_str)
-        self._active_editor = ttk.Entry(self.tree, textvariable=entry_var)
-        self._active_editor.place(x=x, y=y, width=width, height=height, anchor=tk.NW)
-        self._active_editor.focus_set()
-        self._active_editor.selection_range(0, tk.END)
-        self._active_editor.bind("<Return>", lambda e, ed=self._active_editor, iid=item_id: self.on_edit_confirm(e, ed, iid))
-        self._active_editor.bind("<KP_Enter>", lambda e, ed=self._active_editor, iid=item_id: self.on_edit_confirm(e, ed, iid))
-        self._active_editor.bind("<FocusOut>", lambda e, ed=self._active_editor, iid=item_id: self.on_edit_confirm(e, ed, iid))
-        self._active_editor.bind("<Escape>", lambda e, ed=self._active_editor: self.on_edit_cancel(ed))
-    
-    def on_edit_cancel(self, editor_widget):
-        # ... (same as a0.1.3.3)
-        editor_widget.destroy()
+        x, y, width, height = self._tree_bbox(item_id, column=column_id_to_edit)
+        self._editing_item_id = item_id
+        self._editor_var.set(str(current_values_tuple[0]))
+        self._cell_editor.place(x=x, y=y, width=width, height=height, anchor=tk.NW)
+        self._cell_editor.focus_set()
+        self._cell_editor.selection_range(0, tk.END)
+
+    def _hide_cell_editor(self):
+        """Ends the current edit. Clearing _editing_item_id first makes the FocusOut fired by hiding a no-op."""
+        item_id = self._editing_item_id
         self._editing_item_id = None
-        if hasattr(self, '_active_editor'):
-            del self._active_editor
-
-    def on_edit_confirm(self, event, entry_editor, item_id_is_path_str): # item_id_is_path_str is the Treeview iid
-        if not entry_editor.winfo_exists(): return
-        new_value_str = entry_editor.get()
-        entry_editor.destroy()
-        if hasattr(self, '_active_editor'): del self._active_editor
-
-        data_path_tuple = self.item_id_to_path.get(item_id_is_path_str)
-        if data_path_tuple is None:
-            messagebox.showerror("Internal Error", "Could not find data path for edited tree item.")
-            # Attempt to re-display original value if possible, though this state is problematic
-            # For now, do nothing to the tree, as we don't know original value without path
-            return
+        self._cell_editor.place_forget()
+        self.tree.focus_set()
+        return item_id
+    
+    def on_edit_cancel(self, event=None):
+        self._hide_cell_editor()
 
-        original_value = self._get_value_from_path(data_path_tuple)
-        if original_value is None and data_path_tuple: # _get_value_from_path might show its own error
-            # If original_value is legitimately None (e.g. null in YAML), this is fine.
-            # If _get_value_from_path failed and returned None, an error was already shown.
-            pass
+    def on_edit_confirm(self, event=None):
+        if self._editing_item_id is None: return # Edit already confirmed or cancelled
+        new_value_str = self._editor_var.get()
+        item_id = self._hide_cell_editor()
 
+        parent_and_key = self._parent_for_item(item_id)
+        if parent_and_key is None:
+            messagebox.showerror("Internal Error", "Could not find the data for the edited tree item.")
+            return
+        parent, key_or_index = parent_and_key
+        original_value = parent[key_or_index]
 
         # Attempt type conversion based on original value's type
         try:
-            if isinstance(original_value, bool) or original_value is None and new_value_str.lower() in ("true", "false", "yes", "no", "on", "off", "1", "0"): # try to infer bool if original was None
-                if new_value_str.lower() in ("true", "yes", "1", "on"): new_value = True
-                elif new_value_str.lower() in ("false", "no", "0", "off"): new_value = False
-                else: raise ValueError(f"'{new_value_str}' is not a valid boolean representation.")
-            elif isinstance(original_value, int) or original_value is None and new_value_str.lstrip('-').isdigit(): # try to infer int
-                 new_value = int(new_value_str)
-            elif isinstance(original_value, float) or original_value is None and ('.' in new_value_str and new_value_str.replace('.', '', 1).lstrip('-').isdigit()): # try to infer float
-                new_value = float(new_value_str)
-            elif original_value is None and new_value_str.lower() in ('null', 'none', '~', ''): # If original was None, allow setting back to None
-                new_value = None
-            else: # Assume string, or if original_value was None and new_value_str doesn't match above types, treat as string
-                new_value = new_value_str
-            
-            # Update the in-memory self.config_data
-            if self._set_value_at_path(data_path_tuple, new_value):
-                # Update Treeview display
-                self.tree.set(item_id_is_path_str, column="Value", value=str(new_value))
-            else:
-                # _set_value_at_path showed an error, revert Treeview if possible
-                # (though this state implies a deeper issue if path was valid for get but not set)
-                self.tree.set(item_id_is_path_str, column="Value", value=str(original_value if original_value is not None else ''))
-
-
+            new_value = _coerce_edited_value(original_value, new_value_str)
+            parent[key_or_index] = new_value # Update the in-memory self.config_data
+            # String values come back unchanged, so the typed text can be shown as-is.
+            self.tree.set(item_id, column="Value", value=new_value_str if new_value is new_value_str else str(new_value))
         except ValueError as ve:
-            display_key = data_path_tuple[-1] if data_path_tuple else "value"
-            messagebox.showerror("Edit Error", f"Invalid value for '{display_key}': '{new_value_str}'.\n{ve}")
+            messagebox.showerror("Edit Error", f"Invalid value for '{key_or_index}': '{new_value_str}'.\n{ve}")
             # Revert Treeview display to original value
-            self.tree.set(item_id_is_path_str, column="Value", value=str(original_value if original_value is not None else ''))
-        
-        self._editing_item_id = None
+            self.tree.set(item_id, column="Value", value=str(original_value if original_value is not None else ''))
 
 
-    # --- File I/O methods (unchanged from a0.1.3.3) ---
-    def open_file(self): # ... same
+    # --- File I/O methods ---
+    def open_file(self):
         filepath = filedialog.askopenfilename(
             title="Open YAML File",
-            filetypes=(("YAML files", "*.yaml *.yml"), ("All files", "*.*"))
+            filetypes=_YAML_FILETYPES
         )
         if not filepath: return
-        try:
-            self.config_data = yaml_io.load_yaml_file(filepath)
-            self.current_filepath = filepath
-            if self.config_data is not None: 
-                self.root.title(f"Fish Eco Sim - Config Editor Alpha - {os.path.basename(filepath)}")
-            else: 
-                self.root.title(f"Fish Eco Sim - Config Editor Alpha - {os.path.basename(filepath)} (Empty)")
-            self.display_config_data() 
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"File not found: {filepath}")
-            self.current_filepath = None; self.config_data = None
-            self.root.title("Fish Eco Sim - Config Editor Alpha")
-            self.display_config_data() 
-        except yaml_io.yaml.YAMLError as e:
-            messagebox.showerror("Error", f"Error parsing YAML file: {os.path.basename(filepath)}\n\n{e}")
-            self.current_filepath = None; self.config_data = None
-            self.root.title("Fish Eco Sim - Config Editor Alpha")
-            self.display_config_data()
-        except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred while opening file:\n{e}")
-            self.current_filepath = None; self.config_data = None
-            self.root.title("Fish Eco Sim - Config Editor Alpha")
+        basename = os.path.basename(filepath)
+        self._pending_open_path = filepath
+
+        def on_loaded(data, error):
+            if filepath != self._pending_open_path: return # A later open superseded this one
+            if error is None:
+                self.config_data = data
+                self.current_filepath = filepath
+                file_title = f"{self.WINDOW_TITLE} - {basename}"
+                self.root.title(file_title if self.config_data is not None else f"{file_title} (Empty)")
+            else:
+                if isinstance(error, FileNotFoundError):
+                    messagebox.showerror("Error", f"File not found: {filepath}")
+                elif isinstance(error, yaml_io.yaml.YAMLError):
+                    messagebox.showerror("Error", f"Error parsing YAML file: {basename}\n\n{error}")
+                else:
+                    messagebox.showerror("Error", f"An unexpected error occurred while opening file:\n{error}")
+                self.current_filepath = None; self.config_data = None
+                self.root.title(self.WINDOW_TITLE)
             self.display_config_data()
 
-    def save_file(self): # ... same
+        # Read and parse on a worker thread so large files don't freeze the UI.
+        self._run_in_background(lambda: yaml_io.load_yaml_file_cached(filepath), on_loaded)
+
+    def save_file(self):
         if self.current_filepath:
-            try:
-                yaml_io.save_yaml_file(self.config_data, self.current_filepath)
-                messagebox.showinfo("File Saved", f"Successfully saved: {os.path.basename(self.current_filepath)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not save file: {os.path.basename(self.current_filepath)}\n\n{e}")
+            # Write a snapshot on a worker thread so the UI stays responsive;
+            # edits made while the save is in flight go into the next save.
+            filepath = self.current_filepath
+            basename = os.path.basename(filepath)
+            data_snapshot = copy.deepcopy(self.config_data)
+
+            def on_saved(_result, error):
+                if error is None:
+                    messagebox.showinfo("File Saved", f"Successfully saved: {basename}")
+                else:
+                    messagebox.showerror("Error", f"Could not save file: {basename}\n\n{error}")
+
+            self._run_in_background(lambda: yaml_io.save_yaml_file(data_snapshot, filepath), on_saved, writes_file=True)
         else:
             self.save_file_as()
 
-    def save_file_as(self): # ... same
+    def save_file_as(self):
         filepath = filedialog.asksaveasfilename(
             title="Save YAML File As...",
             defaultextension=".yaml",
-            filetypes=(("YAML files", "*.yaml *.yml"), ("All files", "*.*"))
+            filetypes=_YAML_FILETYPES
         )
         if not filepath: return
-        try:
-            yaml_io.save_yaml_file(self.config_data, filepath)
-            self.current_filepath = filepath
-            self.root.title(f"Fish Eco Sim - Config Editor Alpha - {os.path.basename(filepath)}")
-            messagebox.showinfo("File Saved", f"Successfully saved to: {os.path.basename(filepath)}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not save file: {os.path.basename(filepath)}\n\n{e}")
+        basename = os.path.basename(filepath)
+        source, source_path = self.config_data, self.current_filepath
+        data_snapshot = copy.deepcopy(source)
+
+        def on_saved(_result, error):
+            if error is None:
+                # Only adopt the new path if no open replaced the document while saving;
+                # otherwise the next Save would write that document over this file.
+                if self.config_data is source and self.current_filepath == source_path:
+                    self.current_filepath = filepath
+                    self.root.title(f"{self.WINDOW_TITLE} - {basename}")
+                messagebox.showinfo("File Saved", f"Successfully saved to: {basename}")
+            else:
+                messagebox.showerror("Error", f"Could not save file: {basename}\n\n{error}")
+
+        self._run_in_background(lambda: yaml_io.save_yaml_file(data_snapshot, filepath), on_saved, writes_file=True)
 
     def exit_app(self): # ... same
         self.root.quit()
@@ -0,0 +1,129 @@
+# src/modules/config_editor/tests/test_app.py
+
+import unittest
+
+# Assuming 'src' is in PYTHONPATH or tests are run correctly:
+from modules.config_editor.app import ConfigEditorApp, _coerce_edited_value
+
+class _StubTree:
+    """Records Treeview calls made by the paging code, so it can be tested without a display."""
+
+    def __init__(self):
+        self.children = {} # Parent iid -> list of (iid, text) in insertion order
+        self.focused = self.selected = self.seen = None
+
+    def insert(self, parent, index, text="", iid=None, **kwargs):
+        self.children.setdefault(parent, []).append((iid, text))
+        return iid
+
+    def delete(self, *item_ids):
+        for parent, items in self.children.items():
+            self.children[parent] = [item for item in items if item[0] not in item_ids]
+
+    def focus(self, item_id): self.focused = item_id
+    def selection_set(self, item_id): self.selected = item_id
+    def see(self, item_id): self.seen = item_id
+
+class TestEditedValueCoercion(unittest.TestCase):
+
+    def test_bool_original(self):
+        """Test that edits to a boolean accept the usual true/false spellings, case-insensitively."""
+        self.assertIs(_coerce_edited_value(False, "Yes"), True)
+        self.assertIs(_coerce_edited_value(True, "off"), False)
+        self.assertIs(_coerce_edited_value(True, "0"), False)
+        with self.assertRaises(ValueError):
+            _coerce_edited_value(True, "maybe")
+
+    def test_int_original(self):
+        """Test that edits to an int are parsed as int and reject non-integers."""
+        self.assertEqual(_coerce_edited_value(5, "-12"), -12)
+        self.assertIsInstance(_coerce_edited_value(5, "7"), int)
+        with self.assertRaises(ValueError):
+            _coerce_edited_value(5, "1.5")
+
+    def test_float_original(self):
+        """Test that edits to a float are parsed as float, including integer text."""
+        self.assertEqual(_coerce_edited_value(1.5, "2"), 2.0)
+        self.assertIsInstance(_coerce_edited_value(1.5, "2"), float)
+        with self.assertRaises(ValueError):
+            _coerce_edited_value(1.5, "abc")
+
+    def test_string_original(self):
+        """Test that edits to a string are kept verbatim, even if they look like other types."""
+        self.assertEqual(_coerce_edited_value("name", "42"), "42")
+        self.assertEqual(_coerce_edited_value("name", "true"), "true")
+
+    def test_none_original_infers_type(self):
+        """Test that edits to a null value infer bool, int, float, null, then string."""
+        self.assertIs(_coerce_edited_value(None, "on"), True)
+        self.assertIs(_coerce_edited_value(None, "1"), True) # Bool spellings win over int
+        self.assertEqual(_coerce_edited_value(None, "-3"), -3)
+        self.assertEqual(_coerce_edited_value(None, "-.5"), -0.5)
+        self.assertIsNone(_coerce_edited_value(None, "~"))
+        self.assertIsNone(_coerce_edited_value(None, ""))
+        self.assertEqual(_coerce_edited_value(None, "1.2.3"), "1.2.3")
+
+class TestTreePaging(unittest.TestCase):
+
+    def setUp(self):
+        # Bypass __init__, which needs a Tk root; only the tree state used by paging is set up.
+        self.app = ConfigEditorApp.__new__(ConfigEditorApp)
+        self.app.tree = _StubTree()
+        self.app._iid_to_parent = []
+        self.app._placeholder_ids = {}
+        self.app._load_more_ids = {}
+        self.page_size = ConfigEditorApp.CHILDREN_PAGE_SIZE
+
+    def _top_level(self):
+        return self.app.tree.children.get("", [])
+
+    def _load_more_id(self):
+        (load_more_id,) = self.app._load_more_ids
+        return load_more_id
+
+    def test_first_page_and_load_next_label(self):
+        """Test that only one page is inserted, followed by a "load next" item counting the rest."""
+        data = list(range(self.page_size * 2 + 50))
+        self.app._populate_tree("", data)
+        items = self._top_level()
+        self.assertEqual(len(items), self.page_size + 1)
+        self.assertEqual(items[0][1], "[0]")
+        self.assertEqual(items[-1], (self._load_more_id(), f"... load next {self.page_size} of {self.page_size + 50} remaining ..."))
+
+    def test_load_next_pages_through_list(self):
+        """Test that each "load next" appends the following page and maps its iids to the right items."""
+        data = list(range(self.page_size * 2 + 50))
+        self.app._populate_tree("", data)
+        self.app._load_more_children(self._load_more_id())
+        self.assertEqual(self._top_level()[-1][1], "... load next 50 of 50 remaining ...")
+
+        self.app._load_more_children(self._load_more_id())
+        items = self._top_level()
+        self.assertEqual(len(items), len(data)) # Last page is partial and has no "load next" item
+        self.assertEqual(self.app._load_more_ids, {})
+        for index in (self.page_size, self.page_size * 2, len(data) - 1):
+            item_id, text = items[index]
+            self.assertEqual(text, f"[{index}]")
+            container, key_or_index = self.app._parent_for_item(item_id)
+            self.assertIs(container, data)
+            self.assertEqual(key_or_index, index)
+
+    def test_load_next_pages_through_dict(self):
+        """Test that dict pages continue from the right key."""
+        data = {f"key{i}": i for i in range(self.page_size + 3)}
+        self.app._populate_tree("", data)
+        self.app._load_more_children(self._load_more_id())
+        item_id, text = self._top_level()[self.page_size]
+        self.assertEqual(text, f"key{self.page_size}")
+        self.assertEqual(self.app._parent_for_item(item_id), (data, f"key{self.page_size}"))
+
+    def test_load_next_focuses_first_new_item(self):
+        """Test that the first item of the loaded page gets focus, so keyboard navigation keeps working."""
+        self.app._populate_tree("", [{"nested": i} for i in range(self.page_size + 1)])
+        self.app._load_more_children(self._load_more_id())
+        first_new_id = self._top_level()[self.page_size][0]
+        tree = self.app.tree
+        self.assertEqual((tree.focused, tree.selected, tree.seen), (first_new_id,) * 3)
+
+if __name__ == '__main__':
+    unittest.main()
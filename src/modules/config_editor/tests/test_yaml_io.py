@@ -256,5 +256,87 @@ class TestYamlSaving(unittest.TestCase):
         self.assertTrue(loaded_data["extra"])
         self.assertNotIn("original content", str(loaded_data)) # Ensure old content is gone
 
+    def test_save_unserializable_data_keeps_existing_file(self):
+        """Test that a serialization error leaves an existing file untouched."""
+        filepath = os.path.join(self.test_dir.name, "keep_me.yaml")
+        with open(filepath, 'w') as f:
+            f.write("message: original content\n")
+
+        with self.assertRaises(yaml.YAMLError):
+            yaml_io.save_yaml_file({"bad": object()}, filepath)
+
+        with open(filepath, 'r') as f:
+            self.assertEqual(f.read(), "message: original content\n")
+
+class TestYamlLoadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.test_dir.name, "cached.yaml")
+        with open(self.filepath, 'w') as f:
+            f.write("name: original\nsettings:\n  port: 8080\n")
+        yaml_io.clear_load_cache()
+
+    def tearDown(self):
+        yaml_io.clear_load_cache()
+        self.test_dir.cleanup()
+
+    def _rewrite(self, content, mtime_ns):
+        with open(self.filepath, 'w') as f:
+            f.write(content)
+        os.utime(self.filepath, ns=(mtime_ns, mtime_ns))
+
+    def test_cached_load_matches_uncached_load(self):
+        """Test that the cached loader returns the same data as load_yaml_file."""
+        self.assertEqual(yaml_io.load_yaml_file_cached(self.filepath), yaml_io.load_yaml_file(self.filepath))
+
+    def test_cached_load_returns_independent_copies(self):
+        """Test that editing a returned structure does not leak into later loads."""
+        first = yaml_io.load_yaml_file_cached(self.filepath)
+        first['settings']['port'] = 1
+        second = yaml_io.load_yaml_file_cached(self.filepath)
+        self.assertEqual(second['settings']['port'], 8080)
+
+    def test_cached_load_skips_parsing_unchanged_file(self):
+        """Test that a second load of an unchanged file is served from the cache."""
+        yaml_io.load_yaml_file_cached(self.filepath)
+        yaml_io.load_yaml_file_cached(self.filepath)
+        cache_info = yaml_io._load_yaml_file_by_stat.cache_info()
+        self.assertEqual((cache_info.misses, cache_info.hits), (1, 1))
+
+    def test_cached_load_rereads_modified_file(self):
+        """Test that a file modified on disk is parsed again."""
+        self.assertEqual(yaml_io.load_yaml_file_cached(self.filepath)['name'], "original")
+        new_mtime = os.stat(self.filepath).st_mtime_ns + 1_000_000_000
+        self._rewrite("name: changed\n", new_mtime)
+        self.assertEqual(yaml_io.load_yaml_file_cached(self.filepath)['name'], "changed")
+
+    def test_cached_load_rereads_resized_file_with_same_mtime(self):
+        """Test that a rewrite within the mtime granularity is still detected via the file size."""
+        original_mtime = os.stat(self.filepath).st_mtime_ns
+        yaml_io.load_yaml_file_cached(self.filepath)
+        self._rewrite("name: rewritten in the same tick\n", original_mtime)
+        self.assertEqual(yaml_io.load_yaml_file_cached(self.filepath)['name'], "rewritten in the same tick")
+
+    def test_cached_load_shares_entry_across_path_spellings(self):
+        """Test that relative and absolute spellings of one file hit the same cache entry."""
+        relative = os.path.relpath(self.filepath)
+        self.assertEqual(yaml_io.load_yaml_file_cached(relative), yaml_io.load_yaml_file_cached(self.filepath))
+        cache_info = yaml_io._load_yaml_file_by_stat.cache_info()
+        self.assertEqual((cache_info.misses, cache_info.hits, cache_info.currsize), (1, 1, 1))
+
+    def test_save_invalidates_cache(self):
+        """Test that saving through yaml_io drops the cached parse even if the mtime is unchanged."""
+        original_mtime = os.stat(self.filepath).st_mtime_ns
+        yaml_io.load_yaml_file_cached(self.filepath)
+        yaml_io.save_yaml_file({"name": "saved"}, self.filepath)
+        os.utime(self.filepath, ns=(original_mtime, original_mtime))
+        self.assertEqual(yaml_io.load_yaml_file_cached(self.filepath)['name'], "saved")
+
+    def test_cached_load_non_existent_file(self):
+        """Test that the cached loader still raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            yaml_io.load_yaml_file_cached(os.path.join(self.test_dir.name, "missing.yaml"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
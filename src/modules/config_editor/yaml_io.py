@@ -1,8 +1,18 @@
 # src/modules/config_editor/yaml_io.py
 
+import copy
+import functools
 import yaml
 import os # For checking file existence if we want to be more explicit before open, though open() handles it.
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it;
+# they are an order of magnitude faster than the pure-Python implementations.
+# Both are "safe" variants, so no arbitrary Python objects are constructed.
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 def load_yaml_file(filepath: str):
     """
     Loads data from a specified YAML file into a Python dictionary/list structure.
@@ -23,9 +33,9 @@ def load_yaml_file(filepath: str):
     """
     try:
         with open(filepath, 'r') as file:
-            # Using yaml.safe_load() is crucial for security, 
+            # Using a safe loader is crucial for security, 
             # as it prevents arbitrary code execution from untrusted YAML files.
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=_SafeLoader)
             return data
     except FileNotFoundError:
         # Re-raise the exception to be handled by the caller,
@@ -45,6 +55,38 @@ def load_yaml_file(filepath: str):
         # depending on how much detail the caller needs. For now, re-raise.
         raise
 
+@functools.lru_cache(maxsize=16)
+def _load_yaml_file_by_stat(abspath: str, mtime_ns: int, size: int):
+    # The modification time and size are part of the cache key so that a file
+    # changed on disk is re-parsed instead of served stale.
+    return load_yaml_file(abspath)
+
+def load_yaml_file_cached(filepath: str):
+    """
+    Same as load_yaml_file, but reuses the parsed result when the same file is
+    opened again with the same modification time and size as when it was parsed.
+
+    A deep copy is returned on every call, so callers are free to edit the data
+    without corrupting the cached copy.
+
+    Args:
+        filepath (str): The path to the YAML file.
+
+    Returns:
+        dict or list or None: The loaded data (see load_yaml_file).
+
+    Raises:
+        FileNotFoundError: If the specified filepath does not exist.
+        yaml.YAMLError: If the file content is not valid YAML.
+    """
+    abspath = os.path.abspath(filepath) # So "a.yaml" and "./a.yaml" share an entry
+    stat_result = os.stat(abspath) # Raises FileNotFoundError for missing files
+    return copy.deepcopy(_load_yaml_file_by_stat(abspath, stat_result.st_mtime_ns, stat_result.st_size))
+
+def clear_load_cache():
+    """Discards every result cached by load_yaml_file_cached."""
+    _load_yaml_file_by_stat.cache_clear()
+
 def save_yaml_file(data, filepath: str):
     """
     Saves Python data (dictionary or list) to a specified YAML file.
@@ -68,11 +110,17 @@ def save_yaml_file(data, filepath: str):
         if dir_name: # Ensure dirname is not empty (e.g. if filepath is just 'file.yaml')
             os.makedirs(dir_name, exist_ok=True)
 
+        # Serialize to a string first, then write it in one call: PyYAML otherwise issues
+        # many small writes, and a serialization error can no longer truncate the existing file.
+        # default_flow_style=False ensures block style (more readable for configs)
+        # sort_keys=False preserves the order of keys in dictionaries (Python 3.7+ dicts are ordered)
+        # allow_unicode=True is good for handling various text characters
+        text = yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
         with open(filepath, 'w') as file:
-            # default_flow_style=False ensures block style (more readable for configs)
-            # sort_keys=False preserves the order of keys in dictionaries (Python 3.7+ dicts are ordered)
-            # allow_unicode=True is good for handling various text characters
-            yaml.dump(data, file, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            file.write(text)
+        # A save may land within the filesystem's timestamp granularity of the
+        # previous write, so don't rely on the mtime changing to invalidate.
+        clear_load_cache()
     except IOError as e: # Covers issues like permission denied, disk full, etc.
         # print(f"IOError: Could not write to YAML file at {filepath}. Error: {e}") # Optional logging
         raise